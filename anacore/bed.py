@@ -97,7 +97,7 @@ Classes and functions for reading/writing/processing BED files.
 __author__ = 'Frederic Escudie'
 __copyright__ = 'Copyright (C) 2017 IUCT-O'
 __license__ = 'GNU General Public License'
-__version__ = '1.5.1'
+__version__ = '1.6.0'
 __email__ = 'escudie.frederic@iuct-oncopole.fr'
 __status__ = 'prod'
 
@@ -148,19 +148,25 @@ class BEDRecord(Region):
         self.blockSizes = blockSizes
         self.blockStarts = blockStarts
 
-    def __getattribute__(self, attr_name):
-        attr_value = None
-        if attr_name == "chrom":
-            attr_value = object.__getattribute__(self, "reference").name
-        else:
-            attr_value = object.__getattribute__(self, attr_name)
-        return attr_value
+    @property
+    def chrom(self):
+        """
+        Return the name of the chromosome on which the annotation has been defined.
+
+        :return: The name of the chromosome.
+        :rtype: str
+        """
+        return self.reference.name
+
+    @chrom.setter
+    def chrom(self, chrom):
+        """
+        Change the chromosome on which the annotation has been defined.
 
-    def __setattr__(self, attr_name, attr_value):
-        if attr_name == "chrom":
-            self.setReference(attr_value)
-        else:
-            object.__setattr__(self, attr_name, attr_value)
+        :param chrom: The region object or the region name of the chromosome.
+        :type chrom: anacore.region.Region | str
+        """
+        self.setReference(chrom)
 
     @staticmethod
     def recFromRegion(region_record):
@@ -210,21 +216,27 @@ class BEDIO(AbstractFile):
         :return: The BED line corresponding to the record.
         :rtype: str
         """
-        str_fmt = "\t".join(["{}" for idx in range(self._write_nb_col)])
-        line = str_fmt.format(
-            record.chrom,
-            (record.start - 1),
-            record.end,
-            ("." if record.name is None else record.name),
-            ("." if record.score is None else str(record.score)),
-            ("." if record.strand is None else record.strand),
-            ("." if record.thickStart is None else str(record.thickStart - 1)),
-            ("." if record.thickEnd is None else str(record.thickEnd)),
-            ("." if record.itemRgb is None else ",".join(map(str, record.itemRgb))),
-            ("." if record.blockCount is None else str(record.blockCount)),
-            ("." if record.blockSizes is None else ",".join(map(str, record.blockSizes))),
-            ("." if record.blockStarts is None else ",".join(map(str, record.blockStarts)))
-        )
+        nb_col = self._write_nb_col
+        fields = [record.chrom, str(record.start - 1), str(record.end)]
+        if nb_col > 3:
+            fields.append("." if record.name is None else str(record.name))
+            if nb_col > 4:
+                fields.append("." if record.score is None else str(record.score))
+                if nb_col > 5:
+                    fields.append("." if record.strand is None else record.strand)
+                    if nb_col > 6:
+                        fields.append("." if record.thickStart is None else str(record.thickStart - 1))
+                        if nb_col > 7:
+                            fields.append("." if record.thickEnd is None else str(record.thickEnd))
+                            if nb_col > 8:
+                                fields.append("." if record.itemRgb is None else ",".join(map(str, record.itemRgb)))
+                                if nb_col > 9:
+                                    fields.append("." if record.blockCount is None else str(record.blockCount))
+                                    if nb_col > 10:
+                                        fields.append("." if record.blockSizes is None else ",".join(map(str, record.blockSizes)))
+                                        if nb_col > 11:
+                                            fields.append("." if record.blockStarts is None else ",".join(map(str, record.blockStarts)))
+        line = "\t".join(fields)
         return line
 
     def isRecordLine(self, line):
@@ -236,10 +248,7 @@ class BEDIO(AbstractFile):
         :return: True if the line corresponds to a record.
         :rtype: bool
         """
-        is_record = True
-        if line.startswith("browser ") or line.startswith("track ") or line.startswith("#"):
-            is_record = False
-        return is_record
+        return not line.startswith(("browser ", "track ", "#"))
 
     @staticmethod
     def isValid(filepath):
@@ -347,7 +356,7 @@ def getAreas(in_bed):
     """
     areas = RegionList()
     with BEDIO(in_bed) as FH_panel:
-        areas = RegionList(FH_panel.read())
+        areas = RegionList(FH_panel)
     return areas
 
 
@@ -361,11 +370,13 @@ def getAreasByChr(in_bed):
     :rtype: dict
     """
     areas_by_chr = dict()
-    for curr_area in getAreas(in_bed):
-        chrom = curr_area.reference.name
-        if chrom not in areas_by_chr:
-            areas_by_chr[chrom] = RegionList()
-        areas_by_chr[chrom].append(curr_area)
+    with BEDIO(in_bed) as FH_panel:
+        for curr_area in FH_panel:
+            chrom_areas = areas_by_chr.get(curr_area.reference.name)
+            if chrom_areas is None:
+                chrom_areas = RegionList()
+                areas_by_chr[curr_area.reference.name] = chrom_areas
+            chrom_areas.append(curr_area)
     return areas_by_chr
 
 
@@ -378,9 +389,7 @@ def getSortedAreasByChr(in_bed):
     :return: The list of sorted areas by chromosome (each list is an instance of region.Regionlist).
     :rtype: dict
     """
-    areas_by_chr = {}
-    for chrom, areas in getAreasByChr(in_bed).items():
-        areas_by_chr[chrom] = RegionList(
-            sorted(areas, key=lambda x: (x.start, x.end))
-        )
+    areas_by_chr = getAreasByChr(in_bed)
+    for areas in areas_by_chr.values():
+        areas.sort(key=lambda x: (x.start, x.end))
     return areas_by_chr
@@ -117,7 +117,7 @@ Alt representation in VCF specification:
 __author__ = 'Frederic Escudie'
 __copyright__ = 'Copyright (C) 2019 IUCT-O'
 __license__ = 'GNU General Public License'
-__version__ = '2.6.1'
+__version__ = '2.7.0'
 __email__ = 'escudie.frederic@iuct-oncopole.fr'
 __status__ = 'prod'
 
@@ -213,12 +213,9 @@ def getStrand(breakend, is_first=None):
     :rtype: str
     """
     if is_first is None:
-        is_first = True if "RNA_FIRST" in breakend.info else False
-    strand = None
-    if breakend.alt[0].startswith("[") or breakend.alt[0].startswith("]"):
-        strand = "-" if is_first else "+"
-    else:
-        strand = "+" if is_first else "-"
+        is_first = "RNA_FIRST" in breakend.info
+    is_bracket_first = breakend.alt[0].startswith(("[", "]"))
+    strand = "+" if bool(is_first) != is_bracket_first else "-"  # Strand is + for "N[...[" and "N]...]" on first shard, it is the opposite on second shard
     return strand
 
 
@@ -1155,6 +1152,8 @@ class BreakendVCFIO(AnnotVCFIO):
         :type filepath: str
         :param mode: Mode to open the file ('r', 'w', 'a', 'i'). The mode 'i' allow to open file in indexed mode to fetch by region (tabix).
         :type mode: str
+        :param annot_field: The tag for the field used to store annotations.
+        :type annot_field: str
         :return: The new instance.
         :rtype: anacore.fusionVcf.BreakendVCFIO
         """
@@ -1166,7 +1165,7 @@ class BreakendVCFIO(AnnotVCFIO):
             else:
                 self.pick_reader = open(filepath, "r")
             self.loadIndex()
-        self._iter_already_processed = set()
+        self._iter_already_processed = set()  # Fusions returned by iteration and waiting for their second breakend
         super().__init__(filepath, mode, annot_field)
 
     def loadIndex(self):
@@ -1244,6 +1243,11 @@ class BreakendVCFIO(AnnotVCFIO):
         """
         Return True if the line corresponds to a new record (it is not a comment, an header line or an already processed fusion).
 
+        .. warning::
+            This method is not a pure predicate: a line corresponding to the
+            second breakend of a fusion already returned by iteration consumes
+            this pending fusion. It must be called only once by line.
+
         :param line: The evaluated line.
         :type line: str.
         :return: True if the line corresponds to a record.
@@ -1256,8 +1260,9 @@ class BreakendVCFIO(AnnotVCFIO):
             match = re.search("MATEID\=([^;]+);?", mate_info)
             if match:
                 mate_id = decodeInfoValue(match.groups()[0])
-                fusion_id = " @@ ".join(sorted([id, mate_id]))
+                fusion_id = (id, mate_id) if id < mate_id else (mate_id, id)
                 if fusion_id in self._iter_already_processed:  # Partial pre-filtering for records without multi-alternatives
+                    self._iter_already_processed.remove(fusion_id)  # The second breakend is the last occurence of the fusion
                     is_record = False
             else:
                 is_record = False
@@ -1267,8 +1272,10 @@ class BreakendVCFIO(AnnotVCFIO):
         for record in super().__iter__():
             for mate_idx, mate_id in enumerate(record.info["MATEID"]):
                 mate = self.get(mate_id)
-                fusion_id = " @@ ".join(sorted([record.id, mate.id]))
-                if fusion_id not in self._iter_already_processed:
+                fusion_id = (record.id, mate.id) if record.id < mate.id else (mate.id, record.id)
+                if fusion_id in self._iter_already_processed:  # The second breakend is the last occurence of the fusion
+                    self._iter_already_processed.remove(fusion_id)
+                else:
                     self._iter_already_processed.add(fusion_id)
                     # Change ID
                     record_new_id = record.id
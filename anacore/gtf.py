@@ -4,7 +4,7 @@
 __author__ = 'Frederic Escudie'
 __copyright__ = 'Copyright (C) 2018 IUCT-O'
 __license__ = 'GNU General Public License'
-__version__ = '1.1.4'
+__version__ = '1.1.5'
 __email__ = 'escudie.frederic@iuct-oncopole.fr'
 __status__ = 'prod'
 
@@ -170,15 +170,18 @@ def loadModel(gtf_path, feature_handle="exons", restrict_to=None):
                     # Transcript
                     transcript_id = record.annot["transcript_id"]
                     transcript_uid = "{}:{}".format(record.reference.name, transcript_id)  # Add chromosome to prevent collision on sex chromosomes
-                    if transcript_uid not in transcripts:
+                    transcript = transcripts.get(transcript_uid)
+                    if transcript is None:
                         transcript_name = record.annot["transcript_name"] if "transcript_name" in record.annot else None
-                        transcripts[transcript_uid] = Transcript(
+                        transcript = Transcript(
                             None, None, record.strand, record.reference, transcript_name, {"feature": "transcript", "id": transcript_id}
                         )
+                        transcripts[transcript_uid] = transcript
                         # Parent gene
                         gene_id = record.annot["gene_id"]
                         gene_uid = "{}:{}".format(record.reference.name, gene_id)  # Add chromosome to prevent collision on sex chromosomes
-                        if gene_uid not in genes:
+                        gene = genes.get(gene_uid)
+                        if gene is None:
                             gene_name = None
                             if "gene_name" in record.annot:
                                 gene_name = record.annot["gene_name"]
@@ -186,8 +189,7 @@ def loadModel(gtf_path, feature_handle="exons", restrict_to=None):
                                 gene_name = record.annot["gene"]
                             gene = Gene(None, None, record.strand, record.reference, gene_name, {"feature": "gene", "id": gene_id})
                             genes[gene_uid] = gene
-                        genes[gene_uid].addChild(transcripts[transcript_uid])
-                    transcript = transcripts[transcript_uid]
+                        gene.addChild(transcript)
                     # Exon
                     record.name = record.annot["transcript_id"] + "_e" + str(len(transcript.children))
                     record.annot["id"] = record.annot["exon_id"] if "exon_id" in record.annot else record.name
@@ -198,15 +200,18 @@ def loadModel(gtf_path, feature_handle="exons", restrict_to=None):
                     # Transcript
                     transcript_id = record.annot["transcript_id"]
                     transcript_uid = "{}:{}".format(record.reference.name, transcript_id)  # Add chromosome to prevent collision on sex chromosomes
-                    if transcript_uid not in transcripts:
+                    transcript = transcripts.get(transcript_uid)
+                    if transcript is None:
                         transcript_name = record.annot["transcript_name"] if "transcript_name" in record.annot else None
-                        transcripts[transcript_uid] = Transcript(
+                        transcript = Transcript(
                             None, None, record.strand, record.reference, transcript_name, {"feature": "transcript", "id": transcript_id}
                         )
+                        transcripts[transcript_uid] = transcript
                         # Parent gene
                         gene_id = record.annot["gene_id"]
                         gene_uid = "{}:{}".format(record.reference.name, gene_id)  # Add chromosome to prevent collision on sex chromosomes
-                        if gene_uid not in genes:
+                        gene = genes.get(gene_uid)
+                        if gene is None:
                             gene_name = None
                             if "gene_name" in record.annot:
                                 gene_name = record.annot["gene_name"]
@@ -214,15 +219,12 @@ def loadModel(gtf_path, feature_handle="exons", restrict_to=None):
                                 gene_name = record.annot["gene"]
                             gene = Gene(None, None, record.strand, record.reference, gene_name, {"feature": "gene", "id": gene_id})
                             genes[gene_uid] = gene
-                        genes[gene_uid].addChild(transcripts[transcript_uid])
-                    transcript = transcripts[transcript_uid]
+                        gene.addChild(transcript)
                     # Protein
                     protein_id = record.annot["protein_id"] if "protein_id" in record.annot else "prot:None_tr:{}_gene:{}".format(record.annot["transcript_id"], record.annot["gene_id"])
                     protein_uid = "{}:{}".format(record.reference.name, protein_id)  # Add chromosome to prevent collision on sex chromosomes
-                    protein = None
-                    if protein_uid in proteins:
-                        protein = proteins[protein_uid]
-                    else:
+                    protein = proteins.get(protein_uid)
+                    if protein is None:
                         protein = Protein(None, None, record.strand, record.reference, protein_id, {"feature": "protein", "id": protein_id}, None, None, transcript)
                         proteins[protein_uid] = protein
                     # CDS
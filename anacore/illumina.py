@@ -4,14 +4,15 @@
 __author__ = 'Frederic Escudie'
 __copyright__ = 'Copyright (C) 2017 IUCT-O'
 __license__ = 'GNU General Public License'
-__version__ = '1.21.0'
+__version__ = '1.22.0'
 __email__ = 'escudie.frederic@iuct-oncopole.fr'
 __status__ = 'prod'
 
 import os
 import re
-import glob
 import datetime
+import fnmatch
+import glob
 import xml.etree.ElementTree as ET
 
 
@@ -148,12 +149,24 @@ class ADSSampleSheetIO(SampleSheetIO):
         :rtype: dict
         """
         subject_start_tag = subject.capitalize()
+        # Directory is read only once for all samples when patterns only apply on its files names
+        filenames = None
+        if not glob.has_magic(directory) and os.sep not in end_pattern and "/" not in end_pattern:
+            filenames = list()
+            scanned_dir = directory if directory != "" else os.curdir
+            if os.path.isdir(scanned_dir):
+                with os.scandir(scanned_dir) as entries:
+                    filenames = [entry.name for entry in entries]
+        # Select files by sample
         files_by_elt = {}
         for spl in self.samples:
             if subject == "library" or spl["Sample_Name"] not in files_by_elt:  # The subject is the library or the subject is the sample and no library has been already processed for this sample
-                files_by_elt[spl[subject_start_tag + "_Name"]] = sorted(glob.glob(
-                    os.path.join(directory, spl[subject_start_tag + "_Basename"] + end_pattern)
-                ))
+                pattern = spl[subject_start_tag + "_Basename"] + end_pattern
+                if filenames is None:
+                    spl_files = glob.glob(os.path.join(directory, pattern))
+                else:
+                    spl_files = [os.path.join(directory, filename) for filename in fnmatch.filter(filenames, pattern)]
+                files_by_elt[spl[subject_start_tag + "_Name"]] = sorted(spl_files)
         return files_by_elt
 
     def setSplFiles(self, tag, directory, end_pattern, subject="library"):
@@ -4,7 +4,7 @@
 __author__ = 'Frederic Escudie'
 __copyright__ = 'Copyright (C) 2018 IUCT-O'
 __license__ = 'GNU General Public License'
-__version__ = '1.7.0'
+__version__ = '1.7.1'
 __email__ = 'escudie.frederic@iuct-oncopole.fr'
 __status__ = 'prod'
 
@@ -209,12 +209,10 @@ class LocusResDistrib(LocusRes):
             start = self.getMinLength()
         if end is None:
             end = self.getMaxLength()
+        nb_by_length = self.data["nb_by_length"]
         dense_count = list()
         for curr_length in range(start, end + 1):
-            count = 0
-            if str(curr_length) in self.data["nb_by_length"]:
-                count = self.data["nb_by_length"][str(curr_length)]
-            dense_count.append(count)
+            dense_count.append(nb_by_length.get(str(curr_length), 0))
         return dense_count
 
     @staticmethod
@@ -904,14 +902,16 @@ def getNbSupporting(report, method="model", loci=None):
     for spl in report:
         for locus_id in loci:
             locus = spl.loci[locus_id]
-            if locus_id not in nb_by_locus:
-                nb_by_locus[locus_id] = {
+            locus_count = nb_by_locus.get(locus_id)
+            if locus_count is None:
+                locus_count = {
                     "locus_name": locus.name,
                     "supp_by_status": {elt: 0 for elt in Status.authorizedValues()}
                 }
+                nb_by_locus[locus_id] = locus_count
             if method in locus.results:
                 locus_status = locus.results[method].status
-                nb_by_locus[locus_id]["supp_by_status"][locus_status] += 1
+                locus_count["supp_by_status"][locus_status] += 1
     # To list
     counts = []
     for locus_id, locus_info in nb_by_locus.items():
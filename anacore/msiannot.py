@@ -4,7 +4,7 @@
 __author__ = 'Frederic Escudie'
 __copyright__ = 'Copyright (C) 2018 IUCT-O'
 __license__ = 'GNU General Public License'
-__version__ = '1.0.1'
+__version__ = '1.0.2'
 __email__ = 'escudie.frederic@iuct-oncopole.fr'
 __status__ = 'prod'
 
@@ -89,17 +89,11 @@ def getLocusAnnotDict(in_annot):
     with MSIAnnot(in_annot) as FH_in:
         for record in FH_in:
             # Add sample
-            if record["sample"] not in data_by_spl:
-                data_by_spl[record["sample"]] = dict()
-            data_by_locus = data_by_spl[record["sample"]]
+            data_by_locus = data_by_spl.setdefault(record["sample"], dict())
             # Add locus
-            if record["locus_position"] not in data_by_locus:
-                data_by_locus[record["locus_position"]] = dict()
-            data_by_res = data_by_locus[record["locus_position"]]
+            data_by_res = data_by_locus.setdefault(record["locus_position"], dict())
             # Add result method
-            if record["method_id"] not in data_by_res:
-                data_by_res[record["method_id"]] = dict()
-            data_by_key = data_by_res[record["method_id"]]
+            data_by_key = data_by_res.setdefault(record["method_id"], dict())
             # Add data
             data_by_key[record["key"]] = record["value"]
     return data_by_spl
@@ -4,7 +4,7 @@
 __author__ = 'Frederic Escudie'
 __copyright__ = 'Copyright (C) 2017 IUCT-O'
 __license__ = 'GNU General Public License'
-__version__ = '1.8.0'
+__version__ = '1.9.0'
 __email__ = 'escudie.frederic@iuct-oncopole.fr'
 __status__ = 'prod'
 
@@ -422,9 +422,11 @@ def splittedByRef(region_list):
     regions_by_ref = {}
     for curr_region in region_list:
         ref_name = curr_region.reference.name
-        if ref_name not in regions_by_ref:
-            regions_by_ref[ref_name] = RegionList()
-        regions_by_ref[ref_name].append(curr_region)
+        ref_regions = regions_by_ref.get(ref_name)
+        if ref_regions is None:
+            ref_regions = RegionList()
+            regions_by_ref[ref_name] = ref_regions
+        ref_regions.append(curr_region)
     return regions_by_ref
 
 
@@ -525,18 +527,21 @@ def iterOverlapped(queries, subjects, check_ref=True):
             raise Exception("All the queries and subjects in iterOverlapped are not defined on the same reference.")
     subjects = sorted(subjects, key=lambda x: (x.start, x.end))
     queries = sorted(queries, key=lambda x: (x.start, x.end))
+    subjects_start = [elt.start for elt in subjects]  # Coordinates are read once because they can be computed from children (RegionTree)
+    subjects_end = [elt.end for elt in subjects]
     subject_idx = 0
     nb_subjects = len(subjects)
     for curr_query in queries:
+        query_start = curr_query.start
+        query_end = curr_query.end
         # Find overlapping transcripts
-        while subject_idx < nb_subjects and curr_query.start > subjects[subject_idx].end:
+        while subject_idx < nb_subjects and query_start > subjects_end[subject_idx]:
             subject_idx += 1
         first_subject_idx = None
         overlapping_subjects = RegionList()
-        while subject_idx < nb_subjects and curr_query.end >= subjects[subject_idx].start:
-            curr_subject = subjects[subject_idx]
-            if not curr_query.start > curr_subject.end:
-                overlapping_subjects.append(curr_subject)
+        while subject_idx < nb_subjects and query_end >= subjects_start[subject_idx]:
+            if not query_start > subjects_end[subject_idx]:
+                overlapping_subjects.append(subjects[subject_idx])
                 if first_subject_idx is None:
                     first_subject_idx = subject_idx
             subject_idx += 1
@@ -4,7 +4,7 @@
 __author__ = 'Frederic Escudie - Plateforme bioinformatique Toulouse'
 __copyright__ = 'Copyright (C) 2015 INRA'
 __license__ = 'GNU General Public License'
-__version__ = '2.5.0'
+__version__ = '2.6.0'
 __email__ = 'escudie.frederic@iuct-oncopole.fr'
 __status__ = 'prod'
 
@@ -278,12 +278,10 @@ class FastqIO:
         :rtype: int
         """
         handler = open
-        handler_options = "r"
         if isGzip(filepath):
             handler = gzip.open
-            handler_options = "rt"
         nb_lines = 0
-        with handler(filepath, handler_options) as reader:
+        with handler(filepath, "rb") as reader:
             for line in reader:
                 nb_lines += 1
         return int(nb_lines / 4)
@@ -301,11 +299,9 @@ class FastqIO:
         nb_seq = 0
         nb_nt = 0
         handler = open
-        handler_options = "r"
         if isGzip(filepath):
             handler = gzip.open
-            handler_options = "rt"
-        with handler(filepath, handler_options) as reader:
+        with handler(filepath, "rb") as reader:
             for line in reader:
                 nb_seq += 1
                 nb_nt += len(reader.readline().rstrip())
@@ -478,13 +474,11 @@ class FastaIO:
         """
         nb_seq = 0
         handler = open
-        handler_options = "r"
         if isGzip(filepath):
             handler = gzip.open
-            handler_options = "rt"
-        with handler(filepath, handler_options) as reader:
+        with handler(filepath, "rb") as reader:
             for line in reader:
-                if line.startswith(">"):
+                if line.startswith(b">"):
                     nb_seq += 1
         return nb_seq
 
@@ -501,13 +495,11 @@ class FastaIO:
         nb_seq = 0
         nb_nt = 0
         handler = open
-        handler_options = "r"
         if isGzip(filepath):
             handler = gzip.open
-            handler_options = "rt"
-        with handler(filepath, handler_options) as reader:
+        with handler(filepath, "rb") as reader:
             for line in reader:
-                if line.startswith(">"):
+                if line.startswith(b">"):
                     nb_seq += 1
                 else:
                     nb_nt += len(line.rstrip())
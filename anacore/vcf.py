@@ -79,7 +79,7 @@ Classes and functions for reading/writing/processing VCF.
 __author__ = 'Frederic Escudie'
 __copyright__ = 'Copyright (C) 2017 IUCT-O'
 __license__ = 'GNU General Public License'
-__version__ = '1.31.0'
+__version__ = '1.32.0'
 __email__ = 'escudie.frederic@iuct-oncopole.fr'
 __status__ = 'prod'
 
@@ -1064,9 +1064,10 @@ class VCFRecord:
         :rtype: list
         """
         AD = None
+        spl_data = self.samples[spl_name]
         # Retrieve AD from self
-        if "AD" in self.samples[spl_name]:  # The AD is already processed for the sample
-            AD = self.samples[spl_name]["AD"]
+        if "AD" in spl_data:  # The AD is already processed for the sample
+            AD = spl_data["AD"]
         elif len(self.samples) == 1 and spl_name in self.samples and "AD" in self.info:  # Only one sample and AD is already processed for population
             AD = self.info["AD"]
         else:  # AD must be calculated
@@ -1127,13 +1128,14 @@ class VCFRecord:
         """
         # Retrieve AF from self
         AF = None
-        if "AF" in self.samples[spl_name]:  # The AF is already processed for the sample
-            AF = self.samples[spl_name]["AF"]
+        spl_data = self.samples[spl_name]
+        if "AF" in spl_data:  # The AF is already processed for the sample
+            AF = spl_data["AF"]
         else:
             # Get sample AD
             AD = None
-            if "AD" in self.samples[spl_name]:
-                AD = self.samples[spl_name]["AD"] if isinstance(self.samples[spl_name]["AD"], (list, tuple)) else [self.samples[spl_name]["AD"]]
+            if "AD" in spl_data:
+                AD = spl_data["AD"] if isinstance(spl_data["AD"], (list, tuple)) else [spl_data["AD"]]
             if AD is not None and len(AD) == len(self.alt) + 1:  # The AF can be processed from sample's AD (it contains the depth for alleles and reference)
                 DP = sum(AD)
                 if DP == 0:
@@ -1191,16 +1193,17 @@ class VCFRecord:
         :rtype: int
         """
         DP = None
-        if "DP" in self.samples[spl_name]:  # The DP is already processed for the sample
-            DP = self.samples[spl_name]["DP"]
+        spl_data = self.samples[spl_name]
+        if "DP" in spl_data:  # The DP is already processed for the sample
+            DP = spl_data["DP"]
         elif len(self.samples) == 1 and spl_name in self.samples and "DP" in self.info:  # Only one sample and DP is already processed for population
             DP = self.info["DP"]
-        elif "AD" in self.samples[spl_name]:  # DP can be calculated
-            AD = self.samples[spl_name]["AD"] if isinstance(self.samples[spl_name]["AD"], (list, tuple)) else [self.samples[spl_name]["AD"]]
+        elif "AD" in spl_data:  # DP can be calculated
+            AD = spl_data["AD"] if isinstance(spl_data["AD"], (list, tuple)) else [spl_data["AD"]]
             if len(AD) == len(self.alt) + 1:  # Sample contains AD for all alleles and reference
                 DP = sum(AD)
-            elif "AF" in self.samples[spl_name]:  # Sample contains AD for all alleles and AF
-                AF = self.samples[spl_name]["AF"] if isinstance(self.samples[spl_name]["AF"], (list, tuple)) else [self.samples[spl_name]["AF"]]
+            elif "AF" in spl_data:  # Sample contains AD for all alleles and AF
+                AF = spl_data["AF"] if isinstance(spl_data["AF"], (list, tuple)) else [spl_data["AF"]]
                 if len(AF) == len(self.alt) + 1:
                     AF = AF[1:]
                 DP = int(round(AD[0] / AF[0], 0))
@@ -1349,17 +1352,18 @@ class VCFIO(AbstractFile):
                         info[tag_and_value] = True
                     else:
                         tag, value = tag_and_value.split('=', 1)
-                        if self.info[tag]._number == 1:  # The field contains an unique value
-                            info[tag] = self.info[tag]._type(value)
-                            if self.info[tag].type == "String":
+                        tag_header = self.info[tag]
+                        if tag_header._number == 1:  # The field contains an unique value
+                            info[tag] = tag_header._type(value)
+                            if tag_header.type == "String":
                                 info[tag] = decodeInfoValue(info[tag])
-                        else:  # The field contains a list (self.info[tag]._number is None or self.info[tag]._number > 1)
+                        else:  # The field contains a list (tag_header._number is None or tag_header._number > 1)
                             if value == "":
                                 info[tag] = []
-                            elif self.info[tag].type == "String":
-                                info[tag] = [decodeInfoValue(self.info[tag]._type(list_elt)) for list_elt in value.split(",")]
+                            elif tag_header.type == "String":
+                                info[tag] = [decodeInfoValue(tag_header._type(list_elt)) for list_elt in value.split(",")]
                             else:
-                                info[tag] = [self.info[tag]._type(list_elt) for list_elt in value.split(",")]
+                                info[tag] = [tag_header._type(list_elt) for list_elt in value.split(",")]
                 variation.info = info
 
             if len(fields) >= 9:
@@ -1389,16 +1393,16 @@ class VCFIO(AbstractFile):
                                         if list_elt == ".":
                                             spl_data[field_id].append(None)
                                         else:
-                                            value = self.format[field_id]._type(list_elt)
-                                            if self.format[field_id].type == "String":
+                                            value = field_format._type(list_elt)
+                                            if field_format.type == "String":
                                                 value = decodeInfoValue(value)
                                             spl_data[field_id].append(value)
                             elif field_format._number == 1:  # Value is not a list
                                 if field_data == ".":
                                     spl_data[field_id] = None
                                 else:
-                                    spl_data[field_id] = self.format[field_id]._type(field_data)
-                                    if self.format[field_id].type == "String":
+                                    spl_data[field_id] = field_format._type(field_data)
+                                    if field_format.type == "String":
                                         spl_data[field_id] = decodeInfoValue(spl_data[field_id])
                             else:  # Number == 0
                                 spl_data[field_id] = True
@@ -1440,15 +1444,16 @@ class VCFIO(AbstractFile):
             line += "\t."
         else:
             info_fields = list()
-            for key in sorted(record.info):
-                if self.info[key]._number is None or self.info[key]._number > 1:  # The info may cointain a list of values
-                    values = [encodeInfoValue(str(elt)) for elt in record.info[key]]
+            for key, key_value in sorted(record.info.items()):
+                key_header = self.info[key]
+                if key_header._number is None or key_header._number > 1:  # The info may cointain a list of values
+                    values = [encodeInfoValue(str(elt)) for elt in key_value]
                     info_fields.append(key + "=" + ",".join(values))
                 else:  # The info contains a flag or a uniq value
-                    if self.info[key]._type is None:  # Flag
+                    if key_header._type is None:  # Flag
                         info_fields.append(key)
                     else:
-                        value = encodeInfoValue(str(record.info[key]))
+                        value = encodeInfoValue(str(key_value))
                         info_fields.append(key + "=" + value)
             line += "\t" + ";".join(info_fields)
         # Format
@@ -1474,7 +1479,8 @@ class VCFIO(AbstractFile):
                             if key not in record_spl:
                                 spl_fields.append(".")
                             else:
-                                if self.format[key]._number is None or self.format[key]._number > 1:  # The info may cointain a list of values
+                                key_format = self.format[key]
+                                if key_format._number is None or key_format._number > 1:  # The info may cointain a list of values
                                     values = list()
                                     for current_val in record_spl[key]:
                                         value = (encodeInfoValue(str(current_val)) if current_val is not None else ".")
@@ -1539,32 +1545,36 @@ def getAlleleRecord(FH_vcf, record, idx_alt):
         refAllele=record.ref.upper(),  ########################### pb transfo
         altAlleles=[record.alt[idx_alt].upper()],  ########################### pb transfo
         qual=record.qual,
-        pFilter=deepcopy(record.filter),
-        pFormat=deepcopy(record.format)
+        pFilter=list(record.filter),
+        pFormat=(None if record.format is None else list(record.format))
     )
     # Info
-    for key in sorted(record.info):
-        if FH_vcf.info[key].number == "A":
-            new_record.info[key] = [record.info[key][idx_alt]]
-        elif FH_vcf.info[key].number == "R":
-            new_record.info[key] = [record.info[key][0], record.info[key][idx_alt + 1]]
-        elif FH_vcf.info[key]._number is None or FH_vcf.info[key]._number > 1:
-            new_record.info[key] = [elt for elt in record.info[key]]
+    for key, value in sorted(record.info.items()):
+        key_header = FH_vcf.info[key]
+        if key_header.number == "A":
+            new_record.info[key] = [value[idx_alt]]
+        elif key_header.number == "R":
+            new_record.info[key] = [value[0], value[idx_alt + 1]]
+        elif key_header._number is None or key_header._number > 1:
+            new_record.info[key] = [elt for elt in value]
         else:
-            new_record.info[key] = record.info[key]
+            new_record.info[key] = value
     # Samples
-    for spl in record.samples:
-        new_record.samples[spl] = dict()
+    for spl, spl_data in record.samples.items():
+        new_spl_data = dict()
+        new_record.samples[spl] = new_spl_data
         for key in record.format:
-            if key in record.samples[spl]:
-                if FH_vcf.format[key].number == "A":
-                    new_record.samples[spl][key] = [record.samples[spl][key][idx_alt]]
-                elif FH_vcf.format[key].number == "R":
-                    new_record.samples[spl][key] = [record.samples[spl][key][0], record.samples[spl][key][idx_alt + 1]]
-                elif FH_vcf.format[key]._number is None or FH_vcf.format[key]._number > 1:
-                    new_record.samples[spl][key] = [elt for elt in record.samples[spl][key]]
+            if key in spl_data:
+                value = spl_data[key]
+                key_header = FH_vcf.format[key]
+                if key_header.number == "A":
+                    new_spl_data[key] = [value[idx_alt]]
+                elif key_header.number == "R":
+                    new_spl_data[key] = [value[0], value[idx_alt + 1]]
+                elif key_header._number is None or key_header._number > 1:
+                    new_spl_data[key] = [elt for elt in value]
                 else:
-                    new_record.samples[spl][key] = record.samples[spl][key]
+                    new_spl_data[key] = value
     return new_record
 
 
@@ -469,8 +469,10 @@ class BreakendVCFIOTest(unittest.TestCase):
                 first_str = "{}\t{}\t{}".format(first.id, first.info["MATEID"][0], first.alt[0])
                 second_str = "{}\t{}\t{}".format(second.id, second.info["MATEID"][0], second.alt[0])
                 observed.append("{}\t@@\t{}".format(first_str, second_str))
+            pending_fusions = reader._iter_already_processed
         # Eval
         self.assertEqual(expected, observed)
+        self.assertEqual(set(), pending_fusions)
 
     def test_read2(self):
         # Create input tmp
@@ -500,8 +502,10 @@ class BreakendVCFIOTest(unittest.TestCase):
                 first_str = "{}\t{}\t{}".format(first.id, first.info["MATEID"][0], first.alt[0])
                 second_str = "{}\t{}\t{}".format(second.id, second.info["MATEID"][0], second.alt[0])
                 observed.append("{}\t@@\t{}".format(first_str, second_str))
+            pending_fusions = reader._iter_already_processed
         # Eval
         self.assertEqual(expected, observed)
+        self.assertEqual(set(), pending_fusions)
 
     def test_isValid(self):
         # Create input tmp
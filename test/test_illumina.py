@@ -3,11 +3,12 @@
 __author__ = 'Frederic Escudie'
 __copyright__ = 'Copyright (C) 2019 IUCT-O'
 __license__ = 'GNU General Public License'
-__version__ = '1.3.0'
+__version__ = '1.4.0'
 __email__ = 'escudie.frederic@iuct-oncopole.fr'
 __status__ = 'prod'
 
 import os
+import shutil
 import sys
 import uuid
 import tempfile
@@ -18,7 +19,7 @@ TEST_DIR = os.path.dirname(os.path.abspath(__file__))
 PACKAGE_DIR = os.path.dirname(TEST_DIR)
 sys.path.append(PACKAGE_DIR)
 
-from anacore.illumina import Bcl2fastqLog, getInfFromSeqID, RTAComplete, RunInfo, RunParameters
+from anacore.illumina import ADSSampleSheetIO, Bcl2fastqLog, getInfFromSeqID, RTAComplete, RunInfo, RunParameters
 
 
 ########################################################################
@@ -765,6 +766,78 @@ class TestRunParameters(unittest.TestCase):
         self.assertEqual(expected, observed)
 
 
+class TestADSSampleSheetIO(unittest.TestCase):
+    def setUp(self):
+        tmp_folder = tempfile.gettempdir()
+        unique_id = str(uuid.uuid1())
+        self.tmp_sheet = os.path.join(tmp_folder, unique_id + "_SampleSheet.csv")
+        with open(self.tmp_sheet, "w") as handle:
+            handle.write("""[Header],,,
+IEMFileVersion,4,,
+Investigator Name,Test,,
+,,,
+[Reads],,,
+151,,,
+151,,,
+,,,
+[Data],,,
+Sample_ID,Sample_Name,Library_Name,Manifest
+splA_1,splA,splA_1,A
+splA_2,splA,splA_2,B
+splB,splB,splB,A
+""")
+        self.tmp_dir = os.path.join(tmp_folder, unique_id + "_fastq")
+        os.mkdir(self.tmp_dir)
+        for filename in ["splA_S1_L001_R1.fastq.gz", "splA_S1_L001_R2.fastq.gz", "splA_S2_L001_R1.fastq.gz", "splB_S3_L001_R1.fastq.gz", "splB_S3_L001_R1.fastq.gz.md5", "splB-2_S4_L001_R1.fastq.gz"]:
+            with open(os.path.join(self.tmp_dir, filename), "w") as handle:
+                handle.write("")
+        os.mkdir(os.path.join(self.tmp_dir, "splA"))
+        with open(os.path.join(self.tmp_dir, "splA", "R1.fastq.gz"), "w") as handle:
+            handle.write("")
+
+    def tearDown(self):
+        if os.path.exists(self.tmp_sheet):
+            os.remove(self.tmp_sheet)
+        if os.path.exists(self.tmp_dir):
+            shutil.rmtree(self.tmp_dir)
+
+    def testFindSplFiles(self):
+        samplesheet = ADSSampleSheetIO(self.tmp_sheet)
+        # By library
+        expected = {
+            "splA_1": [os.path.join(self.tmp_dir, "splA_S1_L001_R1.fastq.gz"), os.path.join(self.tmp_dir, "splA_S1_L001_R2.fastq.gz")],
+            "splA_2": [os.path.join(self.tmp_dir, "splA_S2_L001_R1.fastq.gz")],
+            "splB": [os.path.join(self.tmp_dir, "splB_S3_L001_R1.fastq.gz")]
+        }
+        observed = samplesheet.findSplFiles(self.tmp_dir, "_L001_R*.fastq.gz")
+        self.assertEqual(expected, observed)
+        # By sample
+        expected = {
+            "splA": [os.path.join(self.tmp_dir, "splA_S1_L001_R1.fastq.gz"), os.path.join(self.tmp_dir, "splA_S2_L001_R1.fastq.gz")],
+            "splB": [os.path.join(self.tmp_dir, "splB_S3_L001_R1.fastq.gz")]
+        }
+        observed = samplesheet.findSplFiles(self.tmp_dir, "_S*_L001_R1.fastq.gz", "sample")
+        self.assertEqual(expected, observed)
+        # Missing directory
+        observed = samplesheet.findSplFiles(self.tmp_dir + "_missing", "_L001_R*.fastq.gz")
+        self.assertEqual({"splA_1": [], "splA_2": [], "splB": []}, observed)
+        # Wildcard in directory
+        expected = {
+            "splA_1": [os.path.join(self.tmp_dir, "splA_S1_L001_R1.fastq.gz")],
+            "splA_2": [os.path.join(self.tmp_dir, "splA_S2_L001_R1.fastq.gz")],
+            "splB": [os.path.join(self.tmp_dir, "splB_S3_L001_R1.fastq.gz")]
+        }
+        observed = samplesheet.findSplFiles(self.tmp_dir[:-1] + "*", "_L001_R1.fastq.gz")
+        self.assertEqual(expected, observed)
+        # Path separator in end pattern
+        expected = {
+            "splA": [os.path.join(self.tmp_dir, "splA", "R1.fastq.gz")],
+            "splB": []
+        }
+        observed = samplesheet.findSplFiles(self.tmp_dir, os.sep + "*.fastq.gz", "sample")
+        self.assertEqual(expected, observed)
+
+
 class TestFunctions(unittest.TestCase):
     def testGetInfFromSeqID(self):
         # Whithout UMI
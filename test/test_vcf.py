@@ -19,7 +19,7 @@ TEST_DIR = os.path.dirname(os.path.abspath(__file__))
 PACKAGE_DIR = os.path.dirname(TEST_DIR)
 sys.path.append(PACKAGE_DIR)
 
-from anacore.vcf import VCFRecord, VCFIO, getHeaderAttr, HeaderInfoAttr
+from anacore.vcf import getAlleleRecord, getHeaderAttr, HeaderInfoAttr, VCFRecord, VCFIO
 
 
 ########################################################################
@@ -117,6 +117,27 @@ class TestVCFIO(unittest.TestCase):
                 if os.path.exists(curr_file):
                     os.remove(curr_file)
 
+    def testGetAlleleRecord(self):
+        with VCFIO(self.tmp_in_variants) as FH_vcf:
+            records = FH_vcf.read()
+            record = records[2]  # 20	1110696	rs6040355	A	G,T	67	PASS	NS=2;DP=10;AF=0.333,0.667;AA=T;DB	GT:GQ:DP:HQ	1|2:21:6:23,27	2|1:2:0:18,2	2/2:35:4
+            # Second allele
+            observed = getAlleleRecord(FH_vcf, record, 1)
+            self.assertEqual(observed.getName(), "20:1110696=A/T")
+            self.assertEqual(observed.info["AF"], [0.667])
+            self.assertEqual(observed.info["DP"], 10)
+            self.assertEqual(observed.format, ["GT", "GQ", "DP", "HQ"])
+            self.assertEqual(observed.samples["NA00001"]["HQ"], [23, 27])
+            self.assertEqual(observed.samples["NA00002"]["HQ"], [18, 2])
+            self.assertNotIn("HQ", observed.samples["NA00003"])
+            # Independence from source record
+            observed.filter.append("lowQual")
+            observed.format.append("AD")
+            observed.samples["NA00001"]["HQ"][0] = 0
+            self.assertEqual(record.filter, ["PASS"])
+            self.assertEqual(record.format, ["GT", "GQ", "DP", "HQ"])
+            self.assertEqual(record.samples["NA00001"]["HQ"], [23, 27])
+
     def testParseHeader(self):
         with VCFIO(self.tmp_in_variants_with_spl_info) as FH_vcf:
             # FORMAT